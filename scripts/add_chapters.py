@@ -7,7 +7,6 @@ Calculates chapter positions by measuring the duration of each TTS segment,
 then maps section headers to cumulative timestamps.
 """
 
-import re
 import sys
 import os
 import subprocess
@@ -15,39 +14,18 @@ import json
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, CTOC, CHAP, TIT2, CTOCFlags
 
+from script_parsing import parse_chapter_sections, section_starts_ms
+
 def get_segment_durations(mp3_dir, date_str):
     """Get duration of the full MP3 and estimate chapter positions from script structure."""
     pass
 
-def parse_script_sections(script_path):
-    """Parse script into sections with their segment counts."""
-    with open(script_path) as f:
-        content = f.read()
-    
-    # Split by ## headers
-    parts = re.split(r'^## ', content, flags=re.MULTILINE)
-    
-    sections = []
-    for part in parts[1:]:  # skip content before first ##
-        lines = part.strip().split('\n')
-        title = lines[0].strip()
-        
-        # Clean up title - remove duration hints
-        clean_title = re.sub(r'\s*\(\d+ (?:min|sec)(?:, [^)]+)?\)\s*$', '', title)
-        
-        # Count dialogue segments in this section
-        body = '\n'.join(lines[1:])
-        segments = re.findall(r'\*\*\w+\*\*:', body)
-        
-        sections.append({
-            'title': clean_title,
-            'segment_count': len(segments),
-        })
-    
-    return sections
-
 def calculate_chapter_times(mp3_path, sections):
-    """Calculate chapter start times based on proportional segment counts."""
+    """Calculate chapter start times based on proportional segment counts.
+    
+    Returns (chapters, total_duration_ms, audio); the opened MP3 is handed back
+    so add_chapters_to_mp3 can write tags without parsing the file again.
+    """
     audio = MP3(mp3_path)
     total_duration_ms = int(audio.info.length * 1000)
     
@@ -55,16 +33,11 @@ def calculate_chapter_times(mp3_path, sections):
     
     # Each segment gets ~equal time (they have similar word counts + silence gap)
     # Calculate cumulative start times
-    chapters = []
-    current_ms = 0
-    
-    for section in sections:
-        chapters.append({
-            'title': section['title'],
-            'start_ms': current_ms,
-        })
-        segment_duration = (section['segment_count'] / total_segments) * total_duration_ms
-        current_ms += int(segment_duration)
+    starts = section_starts_ms(sections, total_segments, total_duration_ms)
+    chapters = [
+        {'title': section['title'], 'start_ms': start_ms}
+        for section, start_ms in zip(sections, starts)
+    ]
     
     # Set end times
     for i, ch in enumerate(chapters):
@@ -73,12 +46,10 @@ def calculate_chapter_times(mp3_path, sections):
         else:
             ch['end_ms'] = total_duration_ms
     
-    return chapters, total_duration_ms
+    return chapters, total_duration_ms, audio
 
-def add_chapters_to_mp3(mp3_path, chapters):
-    """Add ID3v2 chapter frames to MP3."""
-    audio = MP3(mp3_path)
-    
+def add_chapters_to_mp3(audio, chapters):
+    """Add ID3v2 chapter frames to an opened MP3."""
     if audio.tags is None:
         audio.add_tags()
     
@@ -130,13 +101,13 @@ def main():
     script_path = sys.argv[2]
     
     print(f"📖 Parsing script: {script_path}")
-    sections = parse_script_sections(script_path)
+    sections = parse_chapter_sections(script_path)
     
     for s in sections:
         print(f"  📌 {s['title']} ({s['segment_count']} segments)")
     
     print(f"\n⏱️ Calculating chapter times...")
-    chapters, total_ms = calculate_chapter_times(mp3_path, sections)
+    chapters, total_ms, audio = calculate_chapter_times(mp3_path, sections)
     
     for ch in chapters:
         start_m = ch['start_ms'] // 60000
@@ -144,7 +115,7 @@ def main():
         print(f"  [{start_m:02d}:{start_s:02d}] {ch['title']}")
     
     print(f"\n📝 Writing {len(chapters)} chapters to {mp3_path}")
-    count = add_chapters_to_mp3(mp3_path, chapters)
+    count = add_chapters_to_mp3(audio, chapters)
     
     total_m = total_ms // 60000
     total_s = (total_ms % 60000) // 1000
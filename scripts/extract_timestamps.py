@@ -13,164 +13,28 @@ This utility:
 Returns list of {title, timestamp_str} dicts.
 """
 
-import re
+import functools
+import os
 import sys
 import json
 from pathlib import Path
-from mutagen.mp3 import MP3
+try:
+    from mutagen_rs.mp3 import MP3  # faster read-only parser, same .info API
+except ImportError:
+    from mutagen.mp3 import MP3
+from script_parsing import parse_script_sections, section_starts_ms
 
 
-def parse_script_sections(script_path):
-    """Parse script into sections with their segment counts.
-    
-    Handles multiple script formats:
-    - ## Deep Dive 1: Paper Title (one section per paper)
-    - ## Paper 1: Title (one section per paper)  
-    - ### SEGMENT: PAPER 1 — Title (### sub-headers)
-    - ## Deep Dives (single section with --- dividers between papers)
-    """
-    with open(script_path) as f:
-        content = f.read()
-    
-    # First check for ### SEGMENT headers (Feb 9 format)
-    segment_headers = re.findall(r'^### SEGMENT:\s*PAPER\s*\d+\s*[—–-]\s*(.+)', content, re.MULTILINE)
-    if segment_headers:
-        return _parse_segment_format(content)
-    
-    # Check if we have a "## Deep Dives" section with --- dividers
-    if re.search(r'^## Deep Dives\s*$', content, re.MULTILINE):
-        return _parse_deep_dives_block(content)
-    
-    # Default: split by ## headers
-    return _parse_standard_sections(content)
-
-
-def _parse_segment_format(content):
-    """Parse ### SEGMENT: PAPER N — Title format."""
-    parts = re.split(r'^### ', content, flags=re.MULTILINE)
-    sections = []
-    for part in parts[1:]:
-        lines = part.strip().split('\n')
-        title = lines[0].strip()
-        body = '\n'.join(lines[1:])
-        segments = re.findall(r'\*\*\w+\*\*:', body)
-        
-        paper_name = None
-        m = re.match(r'SEGMENT:\s*PAPER\s*\d+\s*[—–-]\s*(.+)', title, re.IGNORECASE)
-        if m:
-            paper_name = m.group(1).strip()
-        
-        clean_title = re.sub(r'\s*\(\d+ (?:min|sec)(?:, [^)]+)?\)\s*$', '', title)
-        
-        sections.append({
-            'title': clean_title,
-            'segment_count': len(segments),
-            'paper_name': paper_name,
-            'is_quick_hits': False,
-        })
-    return sections
-
-
-def _parse_deep_dives_block(content):
-    """Parse ## Deep Dives with --- dividers between papers, plus ## Quick Hits."""
-    sections = []
-    
-    # Split into top-level ## sections first
-    top_parts = re.split(r'^## ', content, flags=re.MULTILINE)
-    
-    for part in top_parts[1:]:
-        lines = part.strip().split('\n')
-        section_title = lines[0].strip()
-        body = '\n'.join(lines[1:])
-        
-        if section_title.lower() == 'deep dives':
-            # Split by --- dividers to get individual paper discussions
-            paper_blocks = re.split(r'\n---+\n', body)
-            for block in paper_blocks:
-                block = block.strip()
-                if not block:
-                    continue
-                segs = re.findall(r'\*\*\w+\*\*:', block)
-                if not segs:
-                    continue
-                # Try to identify paper name from first few dialogue lines
-                paper_name = _extract_paper_name_from_dialogue(block)
-                sections.append({
-                    'title': paper_name or 'Deep Dive',
-                    'segment_count': len(segs),
-                    'paper_name': paper_name,
-                    'is_quick_hits': False,
-                })
-        elif 'quick hit' in section_title.lower():
-            segs = re.findall(r'\*\*\w+\*\*:', body)
-            sections.append({
-                'title': section_title,
-                'segment_count': len(segs),
-                'paper_name': None,
-                'is_quick_hits': True,
-            })
-        else:
-            # Cold Open, Outro, etc.
-            segs = re.findall(r'\*\*\w+\*\*:', body)
-            sections.append({
-                'title': section_title,
-                'segment_count': len(segs),
-                'paper_name': None,
-                'is_quick_hits': False,
-            })
-    
-    return sections
+@functools.lru_cache(maxsize=32)
+def _mp3_duration_ms(path, mtime, size):
+    """MP3 duration in ms, memoized on (path, mtime, size) so repeat lookups skip the parse."""
+    return int(MP3(path).info.length * 1000)
 
 
-def _extract_paper_name_from_dialogue(block):
-    """Try to identify the paper being discussed from dialogue text."""
-    # Look for quoted paper titles or key phrases
-    # Common patterns: "called X", "paper called", "titled", or just quoted titles
-    patterns = [
-        r'(?:called|titled|paper[—–-]|it\'s)\s+["""]?([A-Z][^""".,]{10,60})',
-        r'(?:paper|research|study)(?:\s+is)?\s+(?:about\s+)?["""]([^"""]{10,60})["""]',
-    ]
-    for pat in patterns:
-        m = re.search(pat, block)
-        if m:
-            return m.group(1).strip().rstrip('.')
-    return None
-
-
-def _parse_standard_sections(content):
-    """Parse standard ## Section Title format."""
-    parts = re.split(r'^## ', content, flags=re.MULTILINE)
-    
-    sections = []
-    for part in parts[1:]:
-        lines = part.strip().split('\n')
-        title = lines[0].strip()
-        
-        clean_title = re.sub(r'\s*\(\d+ (?:min|sec)(?:, [^)]+)?\)\s*$', '', title)
-        
-        body = '\n'.join(lines[1:])
-        segments = re.findall(r'\*\*\w+\*\*:', body)
-        
-        paper_name = None
-        for pat in [
-            r'Deep Dive\s*\d*(?:\s*\([^)]*\))?:\s*(.+)',
-            r'Paper\s*\d+:\s*(.+)',
-        ]:
-            m = re.match(pat, clean_title, re.IGNORECASE)
-            if m:
-                paper_name = m.group(1).strip()
-                break
-        
-        is_quick_hits = 'quick hit' in clean_title.lower()
-        
-        sections.append({
-            'title': clean_title,
-            'segment_count': len(segments),
-            'paper_name': paper_name,
-            'is_quick_hits': is_quick_hits,
-        })
-    
-    return sections
+def mp3_duration_ms(mp3_path):
+    """Get MP3 duration in ms, reusing a previous parse if the file is unchanged."""
+    st = os.stat(mp3_path)
+    return _mp3_duration_ms(str(mp3_path), st.st_mtime, st.st_size)
 
 
 def get_paper_timestamps(mp3_path, script_path, date_str=None):
@@ -197,16 +61,15 @@ def get_paper_timestamps(mp3_path, script_path, date_str=None):
                 return mapping
     
     sections = parse_script_sections(script_path)
-    audio = MP3(mp3_path)
-    total_duration_ms = int(audio.info.length * 1000)
+    total_duration_ms = mp3_duration_ms(mp3_path)
     total_segments = sum(s['segment_count'] for s in sections)
     if total_segments == 0:
         return {}
     
     mapping = {'__deep_dive_timestamps__': []}
-    current_ms = 0
+    starts = section_starts_ms(sections, total_segments, total_duration_ms)
     
-    for section in sections:
+    for section, current_ms in zip(sections, starts):
         minutes = current_ms // 60000
         seconds = (current_ms % 60000) // 1000
         ts_str = f"{minutes:02d}:{seconds:02d}"
@@ -217,17 +80,13 @@ def get_paper_timestamps(mp3_path, script_path, date_str=None):
                 mapping['__deep_dive_timestamps__'].append(ts_str)
         if section['is_quick_hits']:
             mapping['__quick_hits__'] = ts_str
-        
-        segment_duration = (section['segment_count'] / total_segments) * total_duration_ms
-        current_ms += int(segment_duration)
     
     return mapping
 
 
 def calculate_proportional_timestamps(mp3_path, sections):
     """Calculate proportional timestamps based on segment counts."""
-    audio = MP3(mp3_path)
-    total_duration_ms = int(audio.info.length * 1000)
+    total_duration_ms = mp3_duration_ms(mp3_path)
     
     total_segments = sum(s['segment_count'] for s in sections)
     if total_segments == 0:
@@ -235,9 +94,9 @@ def calculate_proportional_timestamps(mp3_path, sections):
     
     # Calculate cumulative start times
     timestamps = []
-    current_ms = 0
+    starts = section_starts_ms(sections, total_segments, total_duration_ms)
     
-    for section in sections:
+    for section, current_ms in zip(sections, starts):
         # Format timestamp as MM:SS
         minutes = current_ms // 60000
         seconds = (current_ms % 60000) // 1000
@@ -247,11 +106,6 @@ def calculate_proportional_timestamps(mp3_path, sections):
             'title': section['title'],
             'timestamp_str': timestamp_str
         })
-        
-        # Move to next section
-        if total_segments > 0:
-            segment_duration = (section['segment_count'] / total_segments) * total_duration_ms
-            current_ms += int(segment_duration)
     
     return timestamps
 
@@ -266,7 +120,7 @@ def load_precise_timestamps(date_str, episodes_dir):
         return None
         
     try:
-        with open(timestamps_file) as f:
+        with open(timestamps_file, encoding='utf-8', newline='') as f:
             data = json.load(f)
             
         # Convert to our format
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Generate podcast audio from script using ElevenLabs via sag CLI."""
 
+import asyncio
 import subprocess
 import os
 import re
 import tempfile
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from extract_timestamps import MP3  # mutagen_rs if installed, else mutagen
 
 SCRIPT_PATH = os.path.expanduser("~/projects/arxiv-podcast/episodes/2026-02-09-script.md")
 OUTPUT_DIR = os.path.expanduser("~/projects/arxiv-podcast/episodes")
@@ -17,30 +20,50 @@ VOICES = {
     "Maya": "FGY2WhTYpPnrIDTdsKH5",   # Laura - Enthusiast, Quirky Attitude
 }
 
+# Max sag calls in flight at once (ElevenLabs concurrency limit)
+TTS_CONCURRENCY = 8
+# Held around every sag call, segment or chunk, so nested pools can't exceed the limit
+_SAG_SLOTS = threading.BoundedSemaphore(TTS_CONCURRENCY)
+
+# Invariant command prefixes; per-call args are appended
+_SAG_BASE = ["sag", "--model-id", "eleven_v3"]
+# Silence encoded to match sag output, so it can be stream-copied
+_ANULLSRC = ["ffmpeg", "-y", "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
+             "-c:a", "libmp3lame", "-ar", "44100", "-ac", "1", "-b:a", "128k"]
+# Concat demuxer reading its file list from stdin
+_CONCAT_STDIN = ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
+                 "-protocol_whitelist", "pipe,file", "-i", "pipe:0"]
+
+# Dialogue lines: **Speaker**: text
+_DIALOG_RE = re.compile(r'\*\*(\w+)\*\*:\s*(.*?)(?=\n\n\*\*\w+\*\*:|\n###|\Z)', re.DOTALL)
+# Bold is stripped before italic so ***x*** loses all its asterisks
+_MD_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC = re.compile(r'\*(.+?)\*')
+_WHITESPACE = re.compile(r'\s+')
+
 def parse_script(path):
     """Parse script into ordered list of (speaker, text) tuples."""
-    with open(path, 'r') as f:
+    with open(path, encoding='utf-8') as f:
         content = f.read()
     
-    # Find all dialogue lines: **Speaker**: text
-    pattern = r'\*\*(\w+)\*\*:\s*(.*?)(?=\n\n\*\*\w+\*\*:|\n###|\Z)'
-    matches = re.findall(pattern, content, re.DOTALL)
-    
     lines = []
-    for speaker, text in matches:
-        if speaker in VOICES:
-            # Clean up markdown formatting
-            text = text.strip()
-            text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)  # Remove bold
-            text = re.sub(r'\*(.+?)\*', r'\1', text)  # Remove italic
-            text = text.replace('—', ' — ')
-            text = text.replace('\n', ' ')
-            text = re.sub(r'\s+', ' ', text).strip()
-            if text:
-                lines.append((speaker, text))
+    for speaker, text in _DIALOG_RE.findall(content):
+        if speaker not in VOICES:
+            continue
+        # Clean up markdown formatting
+        text = _MD_ITALIC.sub(r'\1', _MD_BOLD.sub(r'\1', text))
+        text = text.replace('—', ' — ').replace('\n', ' ')
+        text = _WHITESPACE.sub(' ', text).strip()
+        if text:
+            lines.append((speaker, text))
     
     return lines
 
+def _run_sag(cmd):
+    """Run one sag command once a global TTS slot is free."""
+    with _SAG_SLOTS:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+
 def generate_audio_segment(speaker, text, voice_id, index, tmpdir):
     """Generate audio for one dialogue segment using sag."""
     outfile = os.path.join(tmpdir, f"seg_{index:04d}.mp3")
@@ -62,31 +85,32 @@ def generate_audio_segment(speaker, text, voice_id, index, tmpdir):
         if current:
             chunks.append(current.strip())
         
-        # Generate each chunk
-        chunk_files = []
-        for ci, chunk in enumerate(chunks):
+        def _gen_chunk(ci, chunk):
             chunk_file = os.path.join(tmpdir, f"seg_{index:04d}_chunk_{ci:02d}.mp3")
-            cmd = ["sag", "-v", voice_id, "-o", chunk_file, "--model-id", "eleven_v3", chunk]
+            cmd = _SAG_BASE + ["-v", voice_id, "-o", chunk_file, chunk]
             print(f"  Generating chunk {ci+1}/{len(chunks)} for {speaker}...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = _run_sag(cmd)
             if result.returncode != 0:
                 print(f"  ERROR: {result.stderr[:200]}")
                 return None
-            chunk_files.append(chunk_file)
+            return chunk_file
+        
+        # Generate chunks concurrently (map keeps them in order); _SAG_SLOTS caps the total
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as ex:
+            chunk_files = list(ex.map(_gen_chunk, range(len(chunks)), chunks))
+        if None in chunk_files:
+            return None
         
         # Concatenate chunks
         if len(chunk_files) > 1:
-            list_file = os.path.join(tmpdir, f"seg_{index:04d}_list.txt")
-            with open(list_file, 'w') as f:
-                for cf in chunk_files:
-                    f.write(f"file '{cf}'\n")
-            subprocess.run(["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file, 
-                          "-c", "copy", outfile], capture_output=True, timeout=30)
+            subprocess.run(_CONCAT_STDIN + ["-c", "copy", outfile],
+                           input=''.join(f"file '{cf}'\n" for cf in chunk_files),
+                           capture_output=True, text=True, timeout=30)
         else:
             os.rename(chunk_files[0], outfile)
     else:
-        cmd = ["sag", "-v", voice_id, "-o", outfile, "--model-id", "eleven_v3", text]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        cmd = _SAG_BASE + ["-v", voice_id, "-o", outfile, text]
+        result = _run_sag(cmd)
         if result.returncode != 0:
             print(f"  ERROR: {result.stderr[:200]}")
             return None
@@ -96,12 +120,30 @@ def generate_audio_segment(speaker, text, voice_id, index, tmpdir):
 def add_short_silence(tmpdir, index, duration_ms=400):
     """Generate a short silence file."""
     outfile = os.path.join(tmpdir, f"silence_{index:04d}.mp3")
-    subprocess.run([
-        "ffmpeg", "-y", "-f", "lavfi", "-i", f"anullsrc=r=44100:cl=mono",
-        "-t", str(duration_ms/1000), "-q:a", "9", outfile
-    ], capture_output=True, timeout=10)
+    subprocess.run(_ANULLSRC + ["-t", str(duration_ms/1000), outfile],
+                   capture_output=True, timeout=10)
     return outfile if os.path.exists(outfile) else None
 
+async def generate_all_segments(lines, tmpdir, silence):
+    """Generate audio for every line concurrently, each followed by silence, in script order."""
+    sem = asyncio.Semaphore(TTS_CONCURRENCY)
+    audio_files = [None] * (len(lines) * 2)
+    
+    async def gen_one(i, speaker, text):
+        async with sem:
+            print(f"[{i+1}/{len(lines)}] {speaker}: {text[:80]}...")
+            seg_file = await asyncio.to_thread(
+                generate_audio_segment, speaker, text, VOICES[speaker], i, tmpdir)
+        if seg_file:
+            audio_files[i * 2] = seg_file
+            # Add short pause between speakers
+            audio_files[i * 2 + 1] = silence
+        else:
+            print(f"  [{i+1}/{len(lines)}] FAILED - skipping segment")
+    
+    await asyncio.gather(*(gen_one(i, speaker, text) for i, (speaker, text) in enumerate(lines)))
+    return [f for f in audio_files if f]
+
 def main():
     print("=== arXiv AI Podcast Generator ===\n")
     
@@ -116,50 +158,33 @@ def main():
     tmpdir = tempfile.mkdtemp(prefix="podcast_")
     print(f"Working directory: {tmpdir}\n")
     
-    # Generate audio for each segment
-    audio_files = []
-    for i, (speaker, text) in enumerate(lines):
-        voice_id = VOICES[speaker]
-        print(f"[{i+1}/{len(lines)}] {speaker}: {text[:80]}...")
-        
-        seg_file = generate_audio_segment(speaker, text, voice_id, i, tmpdir)
-        if seg_file:
-            audio_files.append(seg_file)
-            # Add short pause between speakers
-            silence = add_short_silence(tmpdir, i)
-            if silence:
-                audio_files.append(silence)
-        else:
-            print(f"  FAILED - skipping segment")
+    # One shared silence file, referenced between every pair of segments
+    silence = add_short_silence(tmpdir, 0)
+    
+    # Generate audio for all segments concurrently
+    audio_files = asyncio.run(generate_all_segments(lines, tmpdir, silence))
     
     if not audio_files:
         print("\nERROR: No audio segments generated!")
         return
     
-    # Concatenate all segments
+    # Concatenate all segments (stream copy — inputs already share codec parameters)
     print(f"\nConcatenating {len(audio_files)} audio files...")
-    list_file = os.path.join(tmpdir, "final_list.txt")
-    with open(list_file, 'w') as f:
-        for af in audio_files:
-            f.write(f"file '{af}'\n")
-    
-    result = subprocess.run([
-        "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file,
-        "-c:a", "libmp3lame", "-q:a", "2", OUTPUT_FILE
-    ], capture_output=True, text=True, timeout=120)
+    result = subprocess.run(
+        _CONCAT_STDIN + ["-c", "copy", OUTPUT_FILE],
+        input=''.join(f"file '{af}'\n" for af in audio_files),
+        capture_output=True, text=True, timeout=120)
     
     if result.returncode == 0:
         size_mb = os.path.getsize(OUTPUT_FILE) / (1024 * 1024)
         print(f"\n✅ Podcast saved: {OUTPUT_FILE} ({size_mb:.1f} MB)")
         
         # Get duration
-        probe = subprocess.run([
-            "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-            "-of", "json", OUTPUT_FILE
-        ], capture_output=True, text=True)
-        if probe.returncode == 0:
-            dur = json.loads(probe.stdout)['format']['duration']
-            mins = float(dur) / 60
+        try:
+            mins = MP3(OUTPUT_FILE).info.length / 60
+        except Exception:
+            mins = None
+        if mins is not None:
             print(f"Duration: {mins:.1f} minutes")
     else:
         print(f"\nERROR concatenating: {result.stderr[:300]}")
@@ -6,20 +6,32 @@ Extracts rich titles and descriptions from episode scripts.
 Includes arXiv paper links from digest files.
 """
 
+import functools
 import os
 import re
 import sys
-import subprocess
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from extract_timestamps import extract_timestamps, get_paper_timestamps
+from extract_timestamps import extract_timestamps, get_paper_timestamps, mp3_duration_ms
 
 REPO_URL = "https://github.com/antonber/paper-weights-podcast"
 COVER_ART_URL = f"{REPO_URL}/releases/download/assets/cover-art.png"
 DIGEST_DIR = Path.home() / "projects" / "arxiv-llm-digest" / "digests"
+RSS_CACHE_FILE = ".rss_cache.json"  # per-episode feed data, inside the episodes dir
+RSS_CACHE_VERSION = 1  # bump when titles/descriptions are built differently
+TIMESTAMPS_CACHE_FILE = ".timestamps_cache.json"  # get_paper_timestamps output, inside the episodes dir
+
+# Episode files by the suffix after "YYYY-MM-DD"
+_EPISODE_FILE_KINDS = {
+    "-podcast-v2.mp3": "mp3_v2",
+    "-podcast.mp3": "mp3",
+    "-script-v2.md": "script_v2",
+    "-script.md": "script",
+    "-timestamps.json": "timestamps",
+}
 
 PODCAST_METADATA = {
     "title": "Paper Weights: Daily AI Research Briefing",
@@ -32,16 +44,59 @@ PODCAST_METADATA = {
     "link": "https://github.com/antonber/paper-weights-podcast",
 }
 
+# Digest formats: "#### N. Title" / "**N. Title** — Author | [arXiv](url)"
+# Title line plus the first arXiv link before the next markdown header line
+# (<=400 chars); the link sits in a lookahead so entries without one don't
+# swallow the next entry's title. Only a '#' opening a line bounds the search,
+# so "C#", "#1" or URL fragments don't.
+_NOT_AT_HEADER = r'(?:(?!\n[ \t]*#)[\s\S])'
+_DIGEST_ENTRY_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'#{1,4}[ \t]*\d+\.[ \t]*(?P<header>[^\n]+)\n'
+    r'(?=(?![ \t]*#)' + _NOT_AT_HEADER + r'{0,400}?(?P<header_url>https?://arxiv\.org/abs/[\w.]+))'
+    r'|\*\*\d+\.[ \t]*(?P<bold>[^\n]+?)\*\*'
+    r'(?=' + _NOT_AT_HEADER + r'{0,400}?(?P<bold_url>https?://arxiv\.org/abs/[\w.]+))'
+    r')',
+    re.MULTILINE,
+)
+_NUM_BOLD_RE = re.compile(r'^\*\*(\d+)\.\s*(.+?)\*\*')
+_DIGEST_HEADER_RE = re.compile(r'^###\s*(\d+)\.\s*(.+)')
+
+# Script formats (see extract_papers_from_script)
+# Header-based formats in one pass; the named group tells which format matched.
+# [ \t] rather than \s so a match never runs past its own header line.
+_FORMAT_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'###[ \t]*SEGMENT:[ \t]*PAPER[ \t]*\d+[ \t]*[—–-][ \t]*(?P<segment>\S.*?)'
+    r'|##[ \t]*Paper[ \t]*\d+:[ \t]*(?P<paper>\S.*?)(?:[ \t]*\(\d+[ \t]*min\))?'
+    r'|##[ \t]*Deep Dive[ \t]*\d+(?:[ \t]*\([^)\n]*\))?:[ \t]*(?P<dive>\S.*?)'
+    r')[ \t\r]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_NUMBERED_SUBHEADER_RE = re.compile(r'###\s*\d+\.\s*(.+)')
+_QUOTED_TITLE_RE = re.compile(r'["\u201c\u201d]([^"\u201c\u201d]{15,80})["\u201c\u201d]')
+# Quoted banter that isn't a paper title
+_SKIP_PHRASES = (
+    "we can", "you're", "i'm", "that's", "it's", "just ",
+    "wait,", "hold on", "let me", "is this", "said it",
+)
+_SKIP_PHRASES_EXTENDED = _SKIP_PHRASES + (
+    "real ", "more ", "need to", "workload", "agentic w",
+)
+
+# Namespace-qualified iTunes tags
+_ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+_ITUNES_AUTHOR = f"{{{_ITUNES_NS}}}author"
+_ITUNES_EXPLICIT = f"{{{_ITUNES_NS}}}explicit"
+_ITUNES_CATEGORY = f"{{{_ITUNES_NS}}}category"
+_ITUNES_IMAGE = f"{{{_ITUNES_NS}}}image"
+_ITUNES_DURATION = f"{{{_ITUNES_NS}}}duration"
+
 
 def get_audio_duration(mp3_path):
-    """Extract duration from MP3 using ffprobe."""
+    """Extract duration from the MP3 header in-process (shared, memoized with timestamp extraction)."""
     try:
-        result = subprocess.run(
-            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-             "-of", "default=noprint_wrappers=1:nokey=1", mp3_path],
-            capture_output=True, text=True, check=True
-        )
-        duration_seconds = float(result.stdout.strip())
+        duration_seconds = mp3_duration_ms(mp3_path) / 1000
         hours = int(duration_seconds // 3600)
         minutes = int((duration_seconds % 3600) // 60)
         seconds = int(duration_seconds % 60)
@@ -51,109 +106,97 @@ def get_audio_duration(mp3_path):
         return "00:15:00"
 
 
-def get_file_size(mp3_path):
-    """Get file size in bytes."""
-    return os.path.getsize(mp3_path)
-
-
+@functools.lru_cache(maxsize=512)
 def load_digest_papers(date_str):
     """
     Load paper titles and arXiv links from the digest file for a given date.
-    Returns list of (title, arxiv_url) tuples.
+    Returns tuple of (title, arxiv_url) tuples (cached, so immutable).
     """
     digest_file = DIGEST_DIR / f"{date_str}.md"
     if not digest_file.exists():
-        return []
+        return ()
 
     try:
         content = digest_file.read_text()
     except Exception:
-        return []
+        return ()
 
     papers = []
-    lines = content.split('\n')
-
-    # Pattern 1: "#### N. Title" followed by "**arXiv**: url" or "| [arXiv](url)"
-    # Pattern 2: "**N. Title** — Author | [arXiv](url)"
-    title_pattern = re.compile(r'^#{1,4}\s*\d+\.\s*(.+?)(?:\s*$)', re.MULTILINE)
-    numbered_bold = re.compile(r'^\*\*(\d+)\.\s*(.+?)\*\*')
-    arxiv_url_pattern = re.compile(r'(?:arxiv\.org/abs/[\w.]+)')
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Format: #### 1. Paper Title
-        title_m = re.match(r'^#{1,4}\s*\d+\.\s*(.+)', line)
-        if title_m:
-            title = title_m.group(1).strip()
-            # Look ahead for arXiv link in next 5 lines
-            arxiv_url = None
-            for j in range(i + 1, min(i + 6, len(lines))):
-                url_m = re.search(r'(https?://arxiv\.org/abs/[\w.]+)', lines[j])
-                if url_m:
-                    arxiv_url = url_m.group(1)
-                    break
-            if arxiv_url:
-                papers.append((title, arxiv_url))
-            i += 1
-            continue
+    for m in _DIGEST_ENTRY_RE.finditer(content):
+        if m.group('header') is not None:
+            papers.append((m.group('header').strip(), m.group('header_url')))
+        else:
+            papers.append((m.group('bold').strip().rstrip('*'), m.group('bold_url')))
 
-        # Format: **1. Title** — Author | [arXiv](url)
-        bold_m = numbered_bold.match(line)
-        if bold_m:
-            title = bold_m.group(2).strip().rstrip('*')
-            url_m = re.search(r'(https?://arxiv\.org/abs/[\w.]+)', line)
-            if url_m:
-                papers.append((title, url_m.group(1)))
-            else:
-                # Check next few lines
-                for j in range(i + 1, min(i + 4, len(lines))):
-                    url_m = re.search(r'(https?://arxiv\.org/abs/[\w.]+)', lines[j])
-                    if url_m:
-                        papers.append((title, url_m.group(1)))
-                        break
-            i += 1
-            continue
+    return tuple(papers)
 
-        i += 1
 
-    return papers
+def build_digest_index(digest_papers):
+    """
+    Pre-tokenize digest entries for match_paper_to_digest.
+    Returns (entries, by_word): entries is a list of (title_lower, significant_words, url)
+    in digest order; by_word maps each significant word to the entry indexes containing it.
+    """
+    entries = []
+    by_word = {}
+    for title, url in digest_papers:
+        title_lower = title.lower()
+        title_words = {w for w in title_lower.split() if len(w) > 3}
+        for w in title_words:
+            by_word.setdefault(w, []).append(len(entries))
+        entries.append((title_lower, title_words, url))
+    return entries, by_word
 
 
-def match_paper_to_digest(paper_name, digest_papers):
+def match_paper_to_digest(paper_name, digest_index):
     """
-    Fuzzy match a paper name from the script to a digest entry.
+    Fuzzy match a paper name from the script to a digest entry (see build_digest_index).
     Returns arxiv_url or None.
     """
-    if not digest_papers:
+    entries, by_word = digest_index
+    if not entries:
         return None
 
     paper_lower = paper_name.lower().strip()
-
-    # Direct substring match
-    for title, url in digest_papers:
-        title_lower = title.lower()
+    paper_words = set(w for w in paper_lower.split() if len(w) > 3)
+
+    # Significant-word overlap per entry, counted only for entries sharing a word
+    overlap = {}
+    for w in paper_words:
+        for idx in by_word.get(w, ()):
+            overlap[idx] = overlap.get(idx, 0) + 1
+    needed = min(2, len(paper_words))
+
+    # First entry in digest order that matches wins
+    for idx, (title_lower, _, url) in enumerate(entries):
+        # Direct substring match
         if paper_lower in title_lower or title_lower in paper_lower:
             return url
         # Check significant words overlap
-        paper_words = set(w for w in paper_lower.split() if len(w) > 3)
-        title_words = set(w for w in title_lower.split() if len(w) > 3)
-        if paper_words and title_words:
-            overlap = paper_words & title_words
-            if len(overlap) >= min(2, len(paper_words)):
-                return url
+        if paper_words and overlap.get(idx, 0) >= needed:
+            return url
 
     return None
 
 
+def _has_two_caps(s):
+    """True if at least two words in s start with a capital letter."""
+    n = 0
+    for w in s.split():
+        if w[0].isupper():
+            n += 1
+            if n >= 2:
+                return True
+    return False
+
+
 def extract_papers_from_script(script_path):
     """
     Extract paper names from a script file.
     Returns (lead_paper, deep_dives, quick_hits)
     """
     try:
-        with open(script_path, 'r') as f:
+        with open(script_path, encoding='utf-8') as f:
             content = f.read()
     except Exception:
         return None, [], []
@@ -161,24 +204,22 @@ def extract_papers_from_script(script_path):
     lines = content.split('\n')
     deep_dives = []
     quick_hits = []
+    # Membership for the dedupe checks; lists keep the order
+    deep_dives_seen = set()
+    quick_hits_seen = set()
 
-    # --- Format 1a: ### SEGMENT: PAPER N — Title ---
-    segment_pattern = re.compile(r'###\s*SEGMENT:\s*PAPER\s*\d+\s*[—–-]\s*(.+)', re.IGNORECASE)
-    for line in lines:
-        m = segment_pattern.match(line.strip())
-        if m:
-            deep_dives.append(m.group(1).strip())
+    headers = {'segment': [], 'paper': [], 'dive': []}
+    for m in _FORMAT_RE.finditer(content):
+        headers[m.lastgroup].append(m.group(m.lastgroup).strip())
 
-    if deep_dives:
+    # --- Format 1a: ### SEGMENT: PAPER N — Title ---
+    if headers['segment']:
+        deep_dives = headers['segment']
         return deep_dives[0], deep_dives, []
 
     # --- Format 1b: ## Paper N: Title ---
-    paper_header = re.compile(r'##\s*Paper\s*\d+:\s*(.+?)(?:\s*\(\d+\s*min\))?$', re.IGNORECASE)
-    for line in lines:
-        m = paper_header.match(line.strip())
-        if m:
-            deep_dives.append(m.group(1).strip())
-    if deep_dives:
+    if headers['paper']:
+        deep_dives = headers['paper']
         # Also check for Quick Hits section
         in_quick = False
         for line in lines:
@@ -190,15 +231,14 @@ def extract_papers_from_script(script_path):
                 break
             if in_quick and (stripped.startswith('**Alex**:') or stripped.startswith('**Maya**:')):
                 dialogue = stripped.split(':', 1)[1].strip()
-                quoted = re.findall(r'["""]([^"""]{15,80})["""]', dialogue)
+                quoted = _QUOTED_TITLE_RE.findall(dialogue)
                 for q in quoted:
-                    cap_words = sum(1 for w in q.split() if w[0].isupper())
-                    if cap_words >= 2 and q not in quick_hits:
+                    if _has_two_caps(q) and q not in quick_hits_seen:
+                        quick_hits_seen.add(q)
                         quick_hits.append(q)
         return deep_dives[0], deep_dives, quick_hits
 
     # --- Format 1c: ### N. Title (under ## Deep Dives) ---
-    numbered_header = re.compile(r'###\s*\d+\.\s*(.+)')
     in_deep_dives = False
     in_quick_hits = False
     for line in lines:
@@ -217,10 +257,11 @@ def extract_papers_from_script(script_path):
                 in_quick_hits = False
             continue
         if in_deep_dives:
-            m = numbered_header.match(stripped)
+            m = _NUMBERED_SUBHEADER_RE.match(stripped)
             if m:
                 title = m.group(1).strip()
-                if title not in deep_dives:
+                if title not in deep_dives_seen:
+                    deep_dives_seen.add(title)
                     deep_dives.append(title)
 
     if deep_dives:
@@ -235,25 +276,18 @@ def extract_papers_from_script(script_path):
                 break
             if in_quick and (stripped.startswith('**Alex**:') or stripped.startswith('**Maya**:')):
                 dialogue = stripped.split(':', 1)[1].strip()
-                quoted = re.findall(r'["""]([^"""]{15,80})["""]', dialogue)
+                quoted = _QUOTED_TITLE_RE.findall(dialogue)
                 for q in quoted:
                     lower_q = q.lower()
-                    if any(phrase in lower_q for phrase in [
-                        "we can", "you're", "i'm", "that's", "it's", "just ",
-                        "wait,", "hold on", "let me", "is this", "said it",
-                    ]):
+                    if any(phrase in lower_q for phrase in _SKIP_PHRASES):
                         continue
-                    cap_words = sum(1 for w in q.split() if w[0].isupper())
-                    if cap_words >= 2 and q not in quick_hits:
+                    if _has_two_caps(q) and q not in quick_hits_seen:
+                        quick_hits_seen.add(q)
                         quick_hits.append(q)
         return deep_dives[0], deep_dives, quick_hits
 
     # --- Format 1d: ## Deep Dive N: Title ---
-    dive_header = re.compile(r'##\s*Deep Dive\s*\d+(?:\s*\([^)]*\))?:\s*(.+)', re.IGNORECASE)
-    for line in lines:
-        m = dive_header.match(line.strip())
-        if m:
-            deep_dives.append(m.group(1).strip())
+    deep_dives = headers['dive']
 
     # Quick Hits from dialogue in ## Quick Hits section
     in_quick = False
@@ -266,17 +300,13 @@ def extract_papers_from_script(script_path):
             break
         if in_quick and (stripped.startswith('**Alex**:') or stripped.startswith('**Maya**:')):
             dialogue = stripped.split(':', 1)[1].strip()
-            quoted = re.findall(r'["""]([^"""]{15,80})["""]', dialogue)
+            quoted = _QUOTED_TITLE_RE.findall(dialogue)
             for q in quoted:
                 lower_q = q.lower()
-                if any(phrase in lower_q for phrase in [
-                    "we can", "you're", "i'm", "that's", "it's", "just ",
-                    "wait,", "hold on", "let me", "is this", "said it",
-                    "real ", "more ", "need to", "workload", "agentic w",
-                ]):
+                if any(phrase in lower_q for phrase in _SKIP_PHRASES_EXTENDED):
                     continue
-                cap_words = sum(1 for w in q.split() if w[0].isupper())
-                if cap_words >= 2 and q not in quick_hits:
+                if _has_two_caps(q) and q not in quick_hits_seen:
+                    quick_hits_seen.add(q)
                     quick_hits.append(q)
 
     if deep_dives:
@@ -284,7 +314,6 @@ def extract_papers_from_script(script_path):
 
     # --- Format 2: Freeform dialogue — extract quoted paper titles ---
     section = None
-    paper_title_pattern = re.compile(r'["""]([^"""]{15,80})["""]')
 
     for line in lines:
         stripped = line.strip()
@@ -303,61 +332,67 @@ def extract_papers_from_script(script_path):
 
         if stripped.startswith('**Alex**:') or stripped.startswith('**Maya**:'):
             dialogue = stripped.split(':', 1)[1].strip()
-            quoted = paper_title_pattern.findall(dialogue)
+            quoted = _QUOTED_TITLE_RE.findall(dialogue)
             for q in quoted:
-                target = deep_dives if section == 'deep' else quick_hits
+                if section == 'deep':
+                    target, target_seen = deep_dives, deep_dives_seen
+                else:
+                    target, target_seen = quick_hits, quick_hits_seen
                 lower_q = q.lower()
-                if any(phrase in lower_q for phrase in [
-                    "we can", "you're", "i'm", "that's", "it's", "just ",
-                    "wait,", "hold on", "let me", "is this", "said it",
-                    "real ", "more ", "need to", "workload", "agentic w",
-                ]):
+                if any(phrase in lower_q for phrase in _SKIP_PHRASES_EXTENDED):
                     continue
-                cap_words = sum(1 for w in q.split() if w[0].isupper())
-                if cap_words < 2:
+                if not _has_two_caps(q):
                     continue
-                if q not in target:
+                if q not in target_seen:
+                    target_seen.add(q)
                     target.append(q)
 
     lead = deep_dives[0] if deep_dives else None
     return lead, deep_dives, quick_hits
 
 
+@functools.lru_cache(maxsize=512)
 def extract_papers_from_digest(date_str):
-    """Fallback: extract papers directly from the arXiv digest file."""
+    """Fallback: extract papers directly from the arXiv digest file (cached; lists returned as tuples)."""
     digest_file = DIGEST_DIR / f"{date_str}.md"
     if not digest_file.exists():
-        return None, [], []
+        return None, (), ()
 
     content = digest_file.read_text()
     deep_dives = []
     quick_hits = []
+    deep_dives_seen = set()
+    quick_hits_seen = set()
 
     for line in content.split('\n'):
         # Format: ### N. Title
-        m = re.match(r'^###\s*(\d+)\.\s*(.+)', line.strip())
+        m = _DIGEST_HEADER_RE.match(line.strip())
         if m:
             num = int(m.group(1))
             title = m.group(2).strip()
             if num <= 7:
+                deep_dives_seen.add(title)
                 deep_dives.append(title)
             else:
+                quick_hits_seen.add(title)
                 quick_hits.append(title)
             continue
         # Format: **N. Title** — Author | [arXiv](url)
-        m = re.match(r'^\*\*(\d+)\.\s*(.+?)\*\*', line.strip())
+        m = _NUM_BOLD_RE.match(line.strip())
         if m:
             num = int(m.group(1))
             title = m.group(2).strip().rstrip('*')
             if num <= 7:
-                if title not in deep_dives:
+                if title not in deep_dives_seen:
+                    deep_dives_seen.add(title)
                     deep_dives.append(title)
             else:
-                if title not in quick_hits:
+                if title not in quick_hits_seen:
+                    quick_hits_seen.add(title)
                     quick_hits.append(title)
 
     lead = deep_dives[0] if deep_dives else None
-    return lead, deep_dives, quick_hits
+    return lead, tuple(deep_dives), tuple(quick_hits)
 
 
 def build_episode_title(script_path, date_formatted, date_str=None):
@@ -377,20 +412,24 @@ def build_episode_title(script_path, date_formatted, date_str=None):
     return "AI Research Briefing"
 
 
-def build_episode_description(script_path, date_str, mp3_path=None):
-    """Build a rich episode description: engaging summary paragraph + paper list with arXiv links + inline timestamps."""
+def build_episode_description(script_path, date_str, mp3_path=None, paper_ts=None):
+    """
+    Build a rich episode description: engaging summary paragraph + paper list with arXiv links + inline timestamps.
+    Pass paper_ts to reuse timestamps already looked up for this episode.
+    """
     lead, deep_dives, quick_hits = extract_papers_from_script(script_path) if script_path else (None, [], [])
 
     # Load digest for arXiv links
-    digest_papers = load_digest_papers(date_str)
+    digest_index = build_digest_index(load_digest_papers(date_str))
 
     # Load paper timestamps if available
-    paper_ts = {}
-    if script_path and mp3_path:
-        try:
-            paper_ts = get_paper_timestamps(mp3_path, script_path, date_str)
-        except Exception as e:
-            print(f"Warning: Could not extract timestamps for {date_str}: {e}", file=sys.stderr)
+    if paper_ts is None:
+        paper_ts = {}
+        if script_path and mp3_path:
+            try:
+                paper_ts = get_paper_timestamps(mp3_path, script_path, date_str)
+            except Exception as e:
+                print(f"Warning: Could not extract timestamps for {date_str}: {e}", file=sys.stderr)
 
     deep_dive_ts_list = paper_ts.get('__deep_dive_timestamps__', [])
     quick_hits_ts = paper_ts.get('__quick_hits__')
@@ -403,7 +442,7 @@ def build_episode_description(script_path, date_str, mp3_path=None):
             ts = quick_hits_ts
         elif not is_quick_hit and index is not None and index < len(deep_dive_ts_list):
             ts = deep_dive_ts_list[index]
-        url = match_paper_to_digest(name, digest_papers)
+        url = match_paper_to_digest(name, digest_index)
         prefix = f"[{ts}] " if ts else ""
         if url:
             return f"• {prefix}{name} — {url}"
@@ -454,33 +493,144 @@ def build_episode_description(script_path, date_str, mp3_path=None):
     return "\n".join(parts)
 
 
-def find_best_mp3(episodes_path, date_str):
-    """Pick the best MP3 for a date (prefer -v2)."""
-    v2 = episodes_path / f"{date_str}-podcast-v2.mp3"
-    base = episodes_path / f"{date_str}-podcast.mp3"
-    if v2.exists():
-        return v2
-    if base.exists():
-        return base
-    return None
+def _scan_episodes(episodes_path):
+    """
+    One scandir pass over the episodes dir, picking the best MP3 and script per date (prefer -v2).
+    Returns {date_str: {"mp3", "mp3_stat", "script", "script_stat", "timestamps_stat"}} for every
+    date with an MP3; script, script_stat and timestamps_stat are None if those files are missing.
+    """
+    found = {}
+    with os.scandir(episodes_path) as it:
+        for entry in it:
+            date_str = "-".join(entry.name.split("-")[:3])
+            kind = _EPISODE_FILE_KINDS.get(entry.name[len(date_str):])
+            if kind and entry.is_file():
+                found.setdefault(date_str, {})[kind] = (Path(entry.path), entry.stat())
+
+    episodes = {}
+    for date_str, files in found.items():
+        mp3 = files.get("mp3_v2") or files.get("mp3")
+        if not mp3:
+            continue
+        script = files.get("script_v2") or files.get("script") or (None, None)
+        episodes[date_str] = {
+            "mp3": mp3[0], "mp3_stat": mp3[1],
+            "script": script[0], "script_stat": script[1],
+            "timestamps_stat": files.get("timestamps", (None, None))[1],
+        }
+    return episodes
 
 
-def find_best_script(episodes_path, date_str):
-    """Find the best script file for a date (prefer -v2)."""
-    v2 = episodes_path / f"{date_str}-script-v2.md"
-    base = episodes_path / f"{date_str}-script.md"
-    if v2.exists():
-        return v2
-    if base.exists():
-        return base
-    return None
+def cached_paper_timestamps(date_str, episode, cached=None):
+    """
+    get_paper_timestamps for an episode's _scan_episodes record (which must have a script),
+    reusing a previous {"key", "timestamps"} record if the MP3, script and precise-timestamps
+    file are unchanged. Hits when the feed entry is rebuilt for other reasons (digest edit,
+    RSS_CACHE_VERSION bump). Returns (timestamps, record to cache).
+    """
+    timestamps_stat = episode["timestamps_stat"]
+    key = [
+        episode["mp3_stat"].st_mtime,
+        episode["script_stat"].st_mtime,
+        timestamps_stat.st_mtime if timestamps_stat else None,
+    ]
+    if cached and cached.get("key") == key:
+        return cached["timestamps"], cached
+    timestamps = get_paper_timestamps(str(episode["mp3"]), str(episode["script"]), date_str)
+    return timestamps, {"key": key, "timestamps": timestamps}
+
+
+def build_episode_entry(date_str, episode, cached_timestamps=None):
+    """
+    Build the feed data for one episode date from its _scan_episodes record.
+    Returns dict with title, description, episode_url, pub_date, file_size, duration
+    and timestamps (record for the timestamps cache, or None),
+    or None if the date doesn't parse.
+    """
+    best_mp3 = episode["mp3"]
+    try:
+        episode_date = datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        print(f"Warning: Could not parse date from {best_mp3.name}, skipping", file=sys.stderr)
+        return None
+
+    script_file = episode["script"]
+
+    duration = get_audio_duration(str(best_mp3))
+    file_size = episode["mp3_stat"].st_size
+    date_formatted = episode_date.strftime("%B %d, %Y")
+
+    timestamps = None
+    if script_file:
+        paper_ts = {}
+        try:
+            paper_ts, timestamps = cached_paper_timestamps(date_str, episode, cached_timestamps)
+        except Exception as e:
+            print(f"Warning: Could not extract timestamps for {date_str}: {e}", file=sys.stderr)
+        title = build_episode_title(str(script_file), date_formatted, date_str=date_str)
+        description = build_episode_description(str(script_file), date_str, str(best_mp3), paper_ts)
+    else:
+        title = build_episode_title(None, date_formatted, date_str=date_str)
+        description = build_episode_description(None, date_str, str(best_mp3))
+
+    return {
+        "title": title,
+        "description": description,
+        "episode_url": f"{REPO_URL}/releases/download/{date_str}/{best_mp3.name}",
+        "pub_date": episode_date.strftime("%a, %d %b %Y 09:00:00 -0600"),
+        "file_size": file_size,
+        "duration": duration,
+        "timestamps": timestamps,
+    }
+
+
+def episode_cache_key(date_str, episode):
+    """
+    Cache key for an episode's _scan_episodes record: the cache version plus the mtimes of
+    every input its feed entry reads (MP3 also by size; None for missing files).
+    """
+    script_stat = episode["script_stat"]
+    timestamps_stat = episode["timestamps_stat"]
+    try:
+        digest_mtime = (DIGEST_DIR / f"{date_str}.md").stat().st_mtime
+    except OSError:
+        digest_mtime = None
+    return {
+        "cache_version": RSS_CACHE_VERSION,
+        "mp3_mtime": episode["mp3_stat"].st_mtime,
+        "mp3_size": episode["mp3_stat"].st_size,
+        "script_mtime": script_stat.st_mtime if script_stat else None,
+        "timestamps_mtime": timestamps_stat.st_mtime if timestamps_stat else None,
+        "digest_mtime": digest_mtime,
+    }
+
+
+def load_json_cache(cache_path):
+    """Load a per-episode JSON cache, or {} if missing/unreadable."""
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+        return {}
+
+
+def save_json_cache(cache_path, cache):
+    """Write a per-episode JSON cache."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}", file=sys.stderr)
 
 
 def create_rss_feed(episodes_dir, output_file):
     """Generate RSS 2.0 podcast feed."""
 
     rss = ET.Element("rss", version="2.0")
-    rss.set("xmlns:itunes", "http://www.itunes.com/dtds/podcast-1.0.dtd")
+    rss.set("xmlns:itunes", _ITUNES_NS)
     rss.set("xmlns:content", "http://purl.org/rss/1.0/modules/content/")
 
     channel = ET.SubElement(rss, "channel")
@@ -490,77 +640,85 @@ def create_rss_feed(episodes_dir, output_file):
     ET.SubElement(channel, "link").text = PODCAST_METADATA["link"]
     ET.SubElement(channel, "language").text = PODCAST_METADATA["language"]
 
-    ET.SubElement(channel, "{http://www.itunes.com/dtds/podcast-1.0.dtd}author").text = PODCAST_METADATA["author"]
-    ET.SubElement(channel, "{http://www.itunes.com/dtds/podcast-1.0.dtd}explicit").text = PODCAST_METADATA["explicit"]
+    ET.SubElement(channel, _ITUNES_AUTHOR).text = PODCAST_METADATA["author"]
+    ET.SubElement(channel, _ITUNES_EXPLICIT).text = PODCAST_METADATA["explicit"]
 
-    itunes_category = ET.SubElement(channel, "{http://www.itunes.com/dtds/podcast-1.0.dtd}category")
+    itunes_category = ET.SubElement(channel, _ITUNES_CATEGORY)
     itunes_category.set("text", PODCAST_METADATA["category"])
 
-    itunes_image = ET.SubElement(channel, "{http://www.itunes.com/dtds/podcast-1.0.dtd}image")
+    itunes_image = ET.SubElement(channel, _ITUNES_IMAGE)
     itunes_image.set("href", COVER_ART_URL)
 
     episodes_path = Path(episodes_dir)
-    mp3_files = sorted(episodes_path.glob("*-podcast*.mp3"), reverse=True)
+    episodes = _scan_episodes(episodes_path)
+    dates = sorted(episodes, reverse=True)
+
+    # Reuse cached entries for episodes whose inputs (MP3, script, timestamps, digest) are unchanged
+    cache_path = episodes_path / RSS_CACHE_FILE
+    cache = load_json_cache(cache_path)
+    keys = {date_str: episode_cache_key(date_str, episodes[date_str]) for date_str in dates}
+    entries = {}
+    stale = []
+    for date_str in dates:
+        cached = cache.get(date_str)
+        key = keys[date_str]
+        if cached and all(cached.get(k) == v for k, v in key.items()):
+            entries[date_str] = cached
+        else:
+            stale.append(date_str)
+
+    # Episodes are independent (duration + script/timestamp parsing), so build them in parallel;
+    # timestamps are reused per episode even when other feed data is stale
+    ts_cache_path = episodes_path / TIMESTAMPS_CACHE_FILE
+    ts_cache = load_json_cache(ts_cache_path)
+    if stale:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            built = ex.map(build_episode_entry, stale, [episodes[date_str] for date_str in stale],
+                           [ts_cache.get(date_str) for date_str in stale])
+            for date_str, entry in zip(stale, built):
+                if entry:
+                    timestamps = entry.pop("timestamps")
+                    if timestamps:
+                        ts_cache[date_str] = timestamps
+                entries[date_str] = entry
+
+    save_json_cache(ts_cache_path, {
+        date_str: ts_cache[date_str] for date_str in dates if date_str in ts_cache
+    })
+
+    save_json_cache(cache_path, {
+        date_str: {**keys[date_str], **entries[date_str]}
+        for date_str in dates if entries[date_str]
+    })
 
-    seen_dates = set()
     episode_count = 0
 
-    for mp3_file in mp3_files:
-        filename = mp3_file.stem
-        date_str = "-".join(filename.split("-")[:3])
-
-        if date_str in seen_dates:
-            continue
-
-        best_mp3 = find_best_mp3(episodes_path, date_str)
-        if not best_mp3:
+    for date_str in dates:
+        entry = entries[date_str]
+        if entry is None:
             continue
 
-        seen_dates.add(date_str)
-
-        try:
-            episode_date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            print(f"Warning: Could not parse date from {mp3_file.name}, skipping", file=sys.stderr)
-            continue
-
-        script_file = find_best_script(episodes_path, date_str)
-
-        duration = get_audio_duration(str(best_mp3))
-        file_size = get_file_size(str(best_mp3))
-        date_formatted = episode_date.strftime("%B %d, %Y")
-
-        if script_file:
-            title = build_episode_title(str(script_file), date_formatted, date_str=date_str)
-            description = build_episode_description(str(script_file), date_str, str(best_mp3))
-        else:
-            title = build_episode_title(None, date_formatted, date_str=date_str)
-            description = build_episode_description(None, date_str, str(best_mp3))
-
-        episode_url = f"{REPO_URL}/releases/download/{date_str}/{best_mp3.name}"
-
         item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = title
-        ET.SubElement(item, "description").text = description
-        ET.SubElement(item, "link").text = episode_url
-        ET.SubElement(item, "guid").text = episode_url
-        ET.SubElement(item, "pubDate").text = episode_date.strftime("%a, %d %b %Y 09:00:00 -0600")
+        ET.SubElement(item, "title").text = entry["title"]
+        ET.SubElement(item, "description").text = entry["description"]
+        ET.SubElement(item, "link").text = entry["episode_url"]
+        ET.SubElement(item, "guid").text = entry["episode_url"]
+        ET.SubElement(item, "pubDate").text = entry["pub_date"]
 
         enclosure = ET.SubElement(item, "enclosure")
-        enclosure.set("url", episode_url)
-        enclosure.set("length", str(file_size))
+        enclosure.set("url", entry["episode_url"])
+        enclosure.set("length", str(entry["file_size"]))
         enclosure.set("type", "audio/mpeg")
 
-        ET.SubElement(item, "{http://www.itunes.com/dtds/podcast-1.0.dtd}duration").text = duration
+        ET.SubElement(item, _ITUNES_DURATION).text = entry["duration"]
 
         episode_count += 1
-        print(f"Added episode: {title} ({duration}, {file_size} bytes)")
+        print(f"Added episode: {entry['title']} ({entry['duration']}, {entry['file_size']} bytes)")
 
     # Pretty print XML
-    xml_str = minidom.parseString(ET.tostring(rss)).toprettyxml(indent="  ")
-
-    with open(output_file, 'w') as f:
-        f.write(xml_str)
+    ET.indent(rss, space="  ")
+    xml_bytes = ET.tostring(rss, xml_declaration=True, encoding='utf-8')
+    Path(output_file).write_bytes(xml_bytes)
 
     print(f"\nRSS feed generated: {output_file}")
     print(f"Episodes included: {episode_count}")
@@ -0,0 +1,233 @@
+"""
+Shared episode-script parsing for the podcast tools.
+
+Used by add_chapters.py and extract_timestamps.py. Splits a script into
+sections with their dialogue segment counts and spreads the episode duration
+over them; results are cached per
+(path, mtime), so repeat lookups within one process skip the parse.
+"""
+
+import functools
+import itertools
+import mmap
+import os
+import re
+
+_SEGMENT_TITLE = re.compile(r'SEGMENT:\s*PAPER\s*\d+\s*[—–-]\s*(.+)', re.IGNORECASE)
+_DIVIDER_SPLIT = re.compile(r'\n---+\n')  # only needed for dividers longer than ---
+_DURATION_HINT = re.compile(r'\s*\(\d+ (?:min|sec)(?:, [^)]+)?\)\s*$')
+_DIALOG_MARKER = re.compile(r'\*\*\w+\*\*:')
+_DEEP_DIVE_TITLE = re.compile(r'Deep Dive\s*\d*(?:\s*\([^)]*\))?:\s*(.+)', re.IGNORECASE)
+_PAPER_TITLE = re.compile(r'Paper\s*\d+:\s*(.+)', re.IGNORECASE)
+
+# Byte patterns for scanning the memory-mapped script without decoding it ([—–-] as UTF-8)
+_SEGMENT_HEADER_B = re.compile(rb'^### SEGMENT:\s*PAPER\s*\d+\s*(?:\xe2\x80\x94|\xe2\x80\x93|-)\s*(.+)', re.MULTILINE)
+_DEEP_DIVES_HEADER_B = re.compile(rb'^## Deep Dives\s*$', re.MULTILINE)
+_SECTION_HEADER_B = re.compile(rb'^## ([^\n]*)', re.MULTILINE)
+_SUBSECTION_HEADER_B = re.compile(rb'^### ([^\n]*)', re.MULTILINE)
+_DIALOG_MARKER_B = re.compile(rb'\*\*\w+\*\*:')
+
+# Look for quoted paper titles or key phrases
+# Common patterns: "called X", "paper called", "titled", or just quoted titles
+_PAPER_NAME_PATTERNS = (
+    re.compile(r'(?:called|titled|paper[—–-]|it\'s)\s+["""]?([A-Z][^""".,]{10,60})'),
+    re.compile(r'(?:paper|research|study)(?:\s+is)?\s+(?:about\s+)?["""]([^"""]{10,60})["""]'),
+)
+
+
+def parse_script_sections(script_path):
+    """Parse script into sections with their segment counts.
+    
+    Handles multiple script formats:
+    - ## Deep Dive 1: Paper Title (one section per paper)
+    - ## Paper 1: Title (one section per paper)  
+    - ### SEGMENT: PAPER 1 — Title (### sub-headers)
+    - ## Deep Dives (single section with --- dividers between papers)
+    """
+    sections = _parse_script_sections(str(script_path), os.path.getmtime(script_path))
+    return [dict(s) for s in sections]
+
+
+def parse_chapter_sections(script_path):
+    """Parse script into one section per ## header with its segment count."""
+    sections = _parse_chapter_sections(str(script_path), os.path.getmtime(script_path))
+    return [dict(s) for s in sections]
+
+
+def section_starts_ms(sections, total_segments, total_duration_ms):
+    """Cumulative start time (ms) of each section, proportional to its segment count."""
+    return itertools.accumulate(
+        (int((s['segment_count'] / total_segments) * total_duration_ms) for s in sections[:-1]),
+        initial=0,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_script_sections(path, mtime):
+    return _with_mapped_script(path, _parse_any_format)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_chapter_sections(path, mtime):
+    return _with_mapped_script(path, _parse_chapters)
+
+
+def _with_mapped_script(path, parse):
+    """Run parse(mm) over a read-only memory map of the script ([] for an empty file).
+
+    The byte patterns expect \n line endings, so CRLF/CR scripts are parsed from a
+    newline-normalized copy instead, as universal-newline reading did.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'\r') != -1:
+                return parse(mm[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n'))
+            return parse(mm)
+
+
+def _parse_any_format(mm):
+    """Detect the script layout and dispatch to its parser."""
+    # First check for ### SEGMENT headers (Feb 9 format)
+    if _SEGMENT_HEADER_B.search(mm):
+        return _parse_segment_format(mm)
+    
+    # Check if we have a "## Deep Dives" section with --- dividers
+    if _DEEP_DIVES_HEADER_B.search(mm):
+        return _parse_deep_dives_block(mm[:].decode('utf-8'))
+    
+    # Default: split by ## headers
+    return _parse_standard_sections(mm)
+
+
+def _parse_chapters(mm):
+    """Parse ## headers only, regardless of layout (one chapter per header)."""
+    return [
+        # Clean up title - remove duration hints
+        {'title': _DURATION_HINT.sub('', title), 'segment_count': segment_count}
+        for title, segment_count in _scan_sections(mm, _SECTION_HEADER_B)
+    ]
+
+
+def _scan_sections(mm, header_re):
+    """Return (title, segment_count) for each header-led section, scanning the mapped file in place.
+    
+    Only header offsets are collected; dialogue markers are counted within each
+    section's byte range, so the only strings materialized are the titles.
+    """
+    headers = list(header_re.finditer(mm))
+    sections = []
+    for i, m in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(mm)
+        count = sum(1 for _ in _DIALOG_MARKER_B.finditer(mm, m.end(), end))
+        sections.append((m.group(1).decode('utf-8').strip(), count))
+    return sections
+
+
+def _parse_segment_format(mm):
+    """Parse ### SEGMENT: PAPER N — Title format."""
+    sections = []
+    for title, segment_count in _scan_sections(mm, _SUBSECTION_HEADER_B):
+        paper_name = None
+        m = _SEGMENT_TITLE.match(title)
+        if m:
+            paper_name = m.group(1).strip()
+        
+        clean_title = _DURATION_HINT.sub('', title)
+        
+        sections.append({
+            'title': clean_title,
+            'segment_count': segment_count,
+            'paper_name': paper_name,
+            'is_quick_hits': False,
+        })
+    return sections
+
+
+def _parse_deep_dives_block(content):
+    """Parse ## Deep Dives with --- dividers between papers, plus ## Quick Hits."""
+    sections = []
+    
+    # Split into top-level ## sections first
+    top_parts = ('\n' + content).split('\n## ')
+    
+    for part in top_parts[1:]:
+        lines = part.strip().split('\n')
+        section_title = lines[0].strip()
+        body = '\n'.join(lines[1:])
+        
+        if section_title.lower() == 'deep dives':
+            # Split by --- dividers to get individual paper discussions
+            if '\n----' in body:
+                paper_blocks = _DIVIDER_SPLIT.split(body)
+            else:
+                paper_blocks = body.split('\n---\n')
+            for block in paper_blocks:
+                block = block.strip()
+                if not block:
+                    continue
+                segs = _DIALOG_MARKER.findall(block)
+                if not segs:
+                    continue
+                # Try to identify paper name from first few dialogue lines
+                paper_name = _extract_paper_name_from_dialogue(block)
+                sections.append({
+                    'title': paper_name or 'Deep Dive',
+                    'segment_count': len(segs),
+                    'paper_name': paper_name,
+                    'is_quick_hits': False,
+                })
+        elif 'quick hit' in section_title.lower():
+            segs = _DIALOG_MARKER.findall(body)
+            sections.append({
+                'title': section_title,
+                'segment_count': len(segs),
+                'paper_name': None,
+                'is_quick_hits': True,
+            })
+        else:
+            # Cold Open, Outro, etc.
+            segs = _DIALOG_MARKER.findall(body)
+            sections.append({
+                'title': section_title,
+                'segment_count': len(segs),
+                'paper_name': None,
+                'is_quick_hits': False,
+            })
+    
+    return sections
+
+
+def _extract_paper_name_from_dialogue(block):
+    """Try to identify the paper being discussed from dialogue text."""
+    for pat in _PAPER_NAME_PATTERNS:
+        m = pat.search(block)
+        if m:
+            return m.group(1).strip().rstrip('.')
+    return None
+
+
+def _parse_standard_sections(mm):
+    """Parse standard ## Section Title format."""
+    sections = []
+    for title, segment_count in _scan_sections(mm, _SECTION_HEADER_B):
+        clean_title = _DURATION_HINT.sub('', title)
+        
+        paper_name = None
+        for pat in (_DEEP_DIVE_TITLE, _PAPER_TITLE):
+            m = pat.match(clean_title)
+            if m:
+                paper_name = m.group(1).strip()
+                break
+        
+        is_quick_hits = 'quick hit' in clean_title.lower()
+        
+        sections.append({
+            'title': clean_title,
+            'segment_count': segment_count,
+            'paper_name': paper_name,
+            'is_quick_hits': is_quick_hits,
+        })
+    
+    return sections
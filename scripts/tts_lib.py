@@ -0,0 +1,204 @@
+"""
+Shared TTS pipeline for the episode generators.
+
+Used by parse_and_tts.py and temp_generate.py. Parses dialogue out of a
+script, generates validated sag segments concurrently, and stitches them
+into one MP3 with silence between turns.
+"""
+
+import subprocess
+import os
+import re
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from extract_timestamps import MP3  # mutagen_rs if installed, else mutagen
+
+VOICES = {
+    "Alex": "iP95p4xoKVk53GoZ742B",
+    "Maya": "FGY2WhTYpPnrIDTdsKH5",
+}
+
+# Segments are independent network calls, so run several at once
+TTS_CONCURRENCY = 8
+
+# Speaker turn runs until a blank line before the next **Name**:, a --- rule,
+# or EOF. The tail only takes a newline that doesn't start one of those, so it
+# never backtracks.
+_DIALOG_RE = re.compile(r'\*\*(\w+)\*\*:\s*((?:[^\n]+|\n(?!\n\*\*\w+\*\*:|---))*)')
+# Bold is stripped before italic so ***x*** loses all its asterisks
+_MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*(.+?)\*')
+
+# Layer III bitrates (kbps) by MPEG-1 / MPEG-2(.5), and sample rates by version bits
+_MP3_BITRATES = (
+    (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_frame_length(header):
+    """Byte length of the Layer III frame starting with this 4-byte header, or 0."""
+    version = (header[1] >> 3) & 3
+    bitrate_idx, rate_idx = header[2] >> 4, (header[2] >> 2) & 3
+    if header[0] != 0xFF or header[1] & 0xE6 != 0xE2 or version == 1 \
+            or bitrate_idx in (0, 15) or rate_idx == 3:
+        return 0
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[mpeg1][bitrate_idx] * 1000
+    return (144 if mpeg1 else 72) * bitrate // _MP3_SAMPLE_RATES[version][rate_idx] + ((header[2] >> 1) & 1)
+
+
+def _mp3_frames(path):
+    """Audio frames of an MP3, without ID3 tags or a leading Xing/Info/VBRI frame."""
+    data = Path(path).read_bytes()
+    start, end = 0, len(data)
+    if data[:3] == b'ID3' and end >= 10:
+        start = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+        if data[5] & 0x10:  # footer present
+            start += 10
+    if end - start >= 128 and data[end - 128:end - 125] == b'TAG':
+        end -= 128
+    frame_len = _mp3_frame_length(data[start:start + 4]) if end - start >= 4 else 0
+    if frame_len:
+        mono = data[start + 3] >> 6 == 3
+        side_info = (17 if mono else 32) if (data[start + 1] >> 3) & 3 == 3 else (9 if mono else 17)
+        tag_at = start + 4 + side_info
+        if data[tag_at:tag_at + 4] in (b'Xing', b'Info') or data[start + 36:start + 40] == b'VBRI':
+            start += frame_len
+    return data[start:end]
+
+
+def parse_script(path):
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    lines = []
+    for speaker, text in _DIALOG_RE.findall(content):
+        if speaker in VOICES:
+            text = _MD_ITALIC_RE.sub(r'\1', _MD_BOLD_RE.sub(r'\1', text))
+            text = ' '.join(text.split())
+            if text:
+                lines.append((speaker, text))
+    return lines
+
+def get_audio_duration(path):
+    """Get duration of an MP3 file in seconds, read from its header in-process."""
+    try:
+        return MP3(path).info.length
+    except Exception:
+        return 0.0
+
+
+def validate_segment(outfile, text_len):
+    """
+    Validate a TTS segment for quality issues.
+    Returns (is_valid, reason).
+    """
+    if not os.path.exists(outfile):
+        return False, "file missing"
+    
+    file_size = os.path.getsize(outfile)
+    duration = get_audio_duration(outfile)
+    
+    # Check 1: File too small (likely empty or corrupted)
+    if file_size < 1000:
+        return False, f"file too small ({file_size} bytes)"
+    
+    # Check 2: Duration too short for text length
+    # Rough heuristic: ~15 chars per second of speech
+    expected_min_duration = max(0.5, text_len / 25)  # very generous lower bound
+    if duration < 0.5:
+        return False, f"duration too short ({duration:.1f}s)"
+    
+    # Check 3: Abnormal bitrate (garbled audio often has weird bitrate)
+    # Normal MP3 at 128kbps: ~16KB per second
+    if duration > 0:
+        bytes_per_sec = file_size / duration
+        if bytes_per_sec < 2000:  # way below normal MP3
+            return False, f"abnormal bitrate ({bytes_per_sec:.0f} B/s)"
+        if bytes_per_sec > 100000:  # way above normal
+            return False, f"abnormal bitrate ({bytes_per_sec:.0f} B/s)"
+    
+    # Check 4: Duration way too long for text (possible looping/stuck)
+    expected_max_duration = text_len / 5  # very generous upper bound (~5 chars/sec)
+    if duration > expected_max_duration and duration > 30:
+        return False, f"duration too long ({duration:.1f}s for {text_len} chars)"
+    
+    return True, f"ok ({duration:.1f}s, {file_size/1024:.0f}KB)"
+
+
+def generate_segment(speaker, text, voice_id, index, tmpdir, max_retries=2):
+    outfile = os.path.join(tmpdir, f"seg_{index:04d}.mp3")
+    # Truncate if too long
+    if len(text) > 2500:
+        # Cut at the last sentence end that fits in 2400 chars
+        cut = max(text.rfind('. ', 0, 2400), text.rfind('! ', 0, 2400), text.rfind('? ', 0, 2400))
+        text = text[:cut + 1] if cut >= 0 else text[:2500]
+    
+    for attempt in range(max_retries + 1):
+        cmd = ["sag", "--model-id", "eleven_v3", "-v", voice_id, "-o", outfile, text]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=60)
+        except Exception as e:
+            print(f"  ❌ Segment {index} generation failed (attempt {attempt+1}): {e}")
+            if attempt < max_retries:
+                print(f"  🔄 Retrying...")
+                continue
+            return None
+        
+        # Validate the output
+        is_valid, reason = validate_segment(outfile, len(text))
+        if is_valid:
+            if attempt > 0:
+                print(f"  ✅ Segment {index} passed validation on retry {attempt+1}: {reason}")
+            return outfile
+        else:
+            print(f"  ⚠️  Segment {index} failed validation (attempt {attempt+1}): {reason}")
+            if attempt < max_retries:
+                print(f"  🔄 Retrying...")
+                # Remove bad file before retry
+                try:
+                    os.remove(outfile)
+                except OSError:
+                    pass
+            else:
+                print(f"  ❌ Segment {index} failed all {max_retries+1} attempts — SKIPPING")
+                return None
+    
+    return None
+
+
+def generate_segments(lines, tmpdir):
+    """
+    Generate every (speaker, text) line concurrently.
+    Returns the segment paths in script order, None for segments that failed.
+    """
+    with ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as ex:
+        futures = {}
+        for i, (speaker, text) in enumerate(lines):
+            print(f"  [{i:03d}] {speaker} ({len(text)} chars)")
+            futures[ex.submit(generate_segment, speaker, text, VOICES[speaker], i, tmpdir)] = i
+        results = {futures[f]: f.result() for f in as_completed(futures)}
+    # Assemble in script order regardless of completion order
+    return [results[i] for i in range(len(lines))]
+
+
+def generate_silence(path, seconds=0.4):
+    """Write a silence clip, CBR to match sag output so stitched files keep duration = size / bitrate."""
+    subprocess.run(["ffmpeg", "-y", "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
+                    "-t", str(seconds), "-c:a", "libmp3lame", "-ac", "1", "-b:a", "128k", str(path)],
+                   capture_output=True)
+
+
+def concat_mp3(segments, silence, output):
+    """Stitch segments' raw MPEG frames with silence between them.
+
+    The output is bare frames: no ID3 tags and no Xing/Info header, so players
+    estimate duration from file size as if it were CBR.
+    """
+    silence_bytes = _mp3_frames(silence)
+    with open(output, 'wb') as out:
+        for i, seg in enumerate(segments):
+            out.write(_mp3_frames(seg))
+            if i < len(segments) - 1:
+                out.write(silence_bytes)
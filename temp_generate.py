@@ -1,99 +1,45 @@
 #!/usr/bin/env python3
-import re
-import subprocess
-import json
-import os
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from tts_lib import parse_script, get_audio_duration, generate_segments, generate_silence, concat_mp3
+
 DATE = "2026-02-11"
 SCRIPT = Path.home() / "projects/arxiv-podcast/episodes" / f"{DATE}-script.md"
 TMPDIR = Path("/tmp/podcast-" + DATE)
 TMPDIR.mkdir(exist_ok=True)
 
-ALEX_VOICE = "iP95p4xoKVk53GoZ742B"  # Chris
-MAYA_VOICE = "FGY2WhTYpPnrIDTdsKH5"  # Laura
-
 print(f"📝 Script: {SCRIPT}")
 print(f"📁 Temp dir: {TMPDIR}")
 
-# Read script
-with open(SCRIPT) as f:
-    content = f.read()
-
 # Parse dialogue segments
-pattern = r'\*\*(\w+)\*\*:\s*(.*?)(?=\n\n\*\*\w+\*\*:|\n---|\Z)'
-matches = re.findall(pattern, content, re.DOTALL)
+lines = parse_script(SCRIPT)
 
-print(f"🎙️ Found {len(matches)} segments")
+print(f"🎙️ Found {len(lines)} segments")
 
 # Generate silence
 silence_path = TMPDIR / "silence.mp3"
-subprocess.run([
-    "ffmpeg", "-y", "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
-    "-t", "0.4", "-q:a", "9", str(silence_path)
-], capture_output=True)
+generate_silence(silence_path)
 
 # Generate each segment
-segment_files = []
-for idx, (speaker, text) in enumerate(matches):
-    text = text.strip()
-    voice = ALEX_VOICE if speaker == "Alex" else MAYA_VOICE
-    
-    padded = f"{idx:03d}"
-    outfile = TMPDIR / f"seg_{padded}.mp3"
-    
-    # Truncate if too long
-    if len(text) > 2500:
-        print(f"  [{padded}] {speaker} (truncating from {len(text)} chars)")
-        text = text[:2500]
-    else:
-        print(f"  [{padded}] {speaker} ({len(text)} chars)")
-    
-    # Generate with sag CLI
-    result = subprocess.run([
-        "sag", "--model-id", "eleven_v3",
-        "-v", voice, "-o", str(outfile), text
-    ], capture_output=True)
-    
-    if result.returncode != 0:
-        print(f"    ❌ Failed: {result.stderr.decode()}")
-        continue
-    
-    if outfile.exists():
-        segment_files.append(str(outfile))
+segment_files = [seg for seg in generate_segments(lines, TMPDIR) if seg]
 
 print(f"\n🔗 Concatenating {len(segment_files)} segments...")
 
-# Build concat list
-concat_list = TMPDIR / "concat.txt"
-with open(concat_list, 'w') as f:
-    for i, seg in enumerate(segment_files):
-        f.write(f"file '{seg}'\n")
-        if i < len(segment_files) - 1:  # Add silence between segments
-            f.write(f"file '{silence_path}'\n")
-
 # Concatenate
 output = Path.home() / "projects/arxiv-podcast/episodes" / f"{DATE}-podcast.mp3"
-result = subprocess.run([
-    "ffmpeg", "-y", "-f", "concat", "-safe", "0",
-    "-i", str(concat_list), "-c", "copy", str(output)
-], capture_output=True)
-
-if result.returncode != 0:
-    print(f"❌ Concatenation failed: {result.stderr.decode()}")
+try:
+    concat_mp3(segment_files, silence_path, output)
+except OSError as e:
+    print(f"❌ Concatenation failed: {e}")
     sys.exit(1)
 
 # Get stats
-stats = subprocess.run([
-    "ffprobe", "-v", "quiet", "-show_format", "-print_format", "json",
-    str(output)
-], capture_output=True, text=True)
+duration = get_audio_duration(output)
 
-if stats.returncode == 0:
-    info = json.loads(stats.stdout)
-    duration = float(info['format']['duration'])
-    size = int(info['format']['size'])
+if duration:
+    size = output.stat().st_size
     
     print(f"\n✅ Episode complete!")
     print(f"📊 Duration: {int(duration // 60)}:{int(duration % 60):02d}")